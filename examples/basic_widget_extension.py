@@ -7,15 +7,62 @@ for the MedICS platform.
 
 from medics_extension_sdk import BaseExtension
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, 
-                               QLabel, QPushButton, QTextEdit, QSpinBox,
-                               QComboBox, QProgressBar)
+                               QStackedLayout, QLabel, QPushButton,
+                               QPlainTextEdit, QSpinBox, QComboBox,
+                               QProgressBar)
 from PySide6.QtCore import Qt, QTimer
-import random
+import asyncio
+from functools import partial
+
+import numpy as np
+
+
+class DeferredWidget(QWidget):
+    """
+    Placeholder widget that builds its real contents when first shown.
+    
+    Registering an extension only creates this lightweight shell; the
+    widget tree returned by ``build`` is created on the first showEvent.
+    """
+    
+    def __init__(self, build, parent=None):
+        super().__init__(parent)
+        self._build = build
+        self._layout = QStackedLayout(self)
+    
+    def showEvent(self, event):
+        if self._build is not None:
+            build, self._build = self._build, None
+            self._layout.addWidget(build())
+        super().showEvent(event)
 
 
 class BasicWidgetExtension(BaseExtension):
     """A basic widget extension demonstrating core functionality."""
     
+    category = "Examples"
+    
+    TITLE_STYLE = "font-size: 18px; font-weight: bold; margin: 10px;"
+    PROCESS_TYPES = ("Random", "Sequential", "Custom")
+    
+    # Delay between simulated processing steps
+    PROCESSING_INTERVAL_MS = 100
+    # Output is flushed to the text area at most this often...
+    LOG_FLUSH_INTERVAL_MS = 100
+    # ...or as soon as this many characters are pending
+    LOG_FLUSH_THRESHOLD = 64 * 1024
+    # Oldest output lines are dropped beyond this many
+    LOG_MAX_LINES = 5000
+    
+    # Output line, log message, event name and extra event data for each
+    # way processing can end
+    _END_STATES = {
+        "completed": ("Processing completed successfully!", "Basic processing completed",
+                      "processing_completed", {"status": "success"}),
+        "stopped": ("Processing stopped by user.", "Processing stopped",
+                    "processing_stopped", {}),
+    }
+    
     def __init__(self, parent=None):
         """Initialize the basic widget extension.
         
@@ -24,6 +71,8 @@ class BasicWidgetExtension(BaseExtension):
         super().__init__(parent=parent,
                          extension_name="Basic Widget Example",
                          author_name="MedICS SDK Team")
+        # Every event payload identifies the extension that sent it
+        self._event_payload = {"extension": self.get_name()}
     
     def get_version(self) -> str:
         return "1.0.0"
@@ -31,18 +80,19 @@ class BasicWidgetExtension(BaseExtension):
     def get_description(self) -> str:
         return "A basic example showing widget-based extension development"
     
-    def get_category(self) -> str:
-        return "Examples"
-    
     def create_widget(self, parent=None, **kwargs):
-        """Create the main widget interface."""
-        widget = QWidget(parent)
+        """Create the main widget interface, deferring its contents until shown."""
+        return DeferredWidget(self._build_widget, parent)
+    
+    def _build_widget(self):
+        """Build the widget tree shown inside the deferred widget."""
+        widget = QWidget()
         layout = QVBoxLayout(widget)
         
         # Title
         title = QLabel("Basic Widget Extension")
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet("font-size: 18px; font-weight: bold; margin: 10px;")
+        title.setStyleSheet(self.TITLE_STYLE)
         layout.addWidget(title)
         
         # Controls section
@@ -59,7 +109,7 @@ class BasicWidgetExtension(BaseExtension):
         # Processing type
         controls_layout.addWidget(QLabel("Type:"))
         self.process_type = QComboBox()
-        self.process_type.addItems(["Random", "Sequential", "Custom"])
+        self.process_type.addItems(self.PROCESS_TYPES)
         controls_layout.addWidget(self.process_type)
         
         layout.addWidget(controls_widget)
@@ -89,16 +139,28 @@ class BasicWidgetExtension(BaseExtension):
         layout.addWidget(self.progress_bar)
         
         # Output area
-        self.output_text = QTextEdit()
+        self.output_text = QPlainTextEdit()
         self.output_text.setReadOnly(True)
+        self.output_text.setMaximumBlockCount(self.LOG_MAX_LINES)
         self.output_text.setPlaceholderText("Processing output will appear here...")
         layout.addWidget(self.output_text)
         
-        # Setup timer for simulated processing
+        # Simulated processing runs as an asyncio task under QtAsyncio,
+        # and falls back to a timer under a plain Qt event loop
         self.processing_timer = QTimer()
         self.processing_timer.timeout.connect(self.update_processing)
+        self._processing_task = None
         self.processing_step = 0
         
+        # Buffer output lines and flush them in one append to avoid a
+        # re-layout of the text area for every line
+        self._log_buffer = []
+        self._log_buffer_size = 0
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.LOG_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_log)
+        
         return widget
     
     def start_processing(self):
@@ -106,31 +168,33 @@ class BasicWidgetExtension(BaseExtension):
         self.log_message("Starting basic processing...")
         
         # Update UI state
-        self.start_button.setEnabled(False)
-        self.stop_button.setEnabled(True)
-        self.progress_bar.setVisible(True)
+        self._set_running_state(True)
         self.progress_bar.setValue(0)
         
         # Get parameters
         sample_size = self.sample_size.value()
         process_type = self.process_type.currentText()
         
-        self.output_text.append(f"Starting {process_type} processing with {sample_size} samples...")
+        self._append_output(f"Starting {process_type} processing with {sample_size} samples...")
         
         # Setup processing simulation
         self.processing_step = 0
         self.max_steps = sample_size // 10  # Simulate processing in chunks
         self.progress_bar.setMaximum(self.max_steps)
         
+        # Draw the values reported every 3rd step up front
+        self._random_values = np.random.randint(1, 101, size=self.max_steps // 3 + 1, dtype=np.int32)
+        self._random_index = 0
+        
         # Send event to notify other extensions
-        self.send_event("processing_started", {
-            "extension": self.get_name(),
+        self._post_event("processing_started", {
+            **self._event_payload,
             "sample_size": sample_size,
             "type": process_type
         })
         
-        # Start processing timer
-        self.processing_timer.start(100)  # Update every 100ms
+        # Start stepping through the simulation
+        self._start_ticker()
     
     def update_processing(self):
         """Update processing simulation."""
@@ -139,8 +203,9 @@ class BasicWidgetExtension(BaseExtension):
         
         # Simulate processing output
         if self.processing_step % 3 == 0:
-            value = random.randint(1, 100)
-            self.output_text.append(f"Step {self.processing_step}: Processed value {value}")
+            value = int(self._random_values[self._random_index])
+            self._random_index += 1
+            self._append_output(f"Step {self.processing_step}: Processed value {value}")
         
         # Check if processing is complete
         if self.processing_step >= self.max_steps:
@@ -148,43 +213,98 @@ class BasicWidgetExtension(BaseExtension):
     
     def finish_processing(self):
         """Finish processing."""
-        self.processing_timer.stop()
+        self._end_processing("completed")
+    
+    def stop_processing(self):
+        """Stop processing."""
+        self._end_processing("stopped")
+    
+    def _end_processing(self, reason):
+        """Stop the simulation and report why it ended."""
+        output, log, event_name, extra = self._END_STATES[reason]
+        self._stop_ticker()
         
         # Update UI state
-        self.start_button.setEnabled(True)
-        self.stop_button.setEnabled(False)
-        self.progress_bar.setVisible(False)
+        self._set_running_state(False)
         
-        self.output_text.append("Processing completed successfully!")
-        self.log_message("Basic processing completed")
+        self._append_output(output)
+        self.log_message(log)
         
-        # Send completion event
-        self.send_event("processing_completed", {
-            "extension": self.get_name(),
+        # Notify other extensions
+        self._post_event(event_name, {
+            **self._event_payload,
             "steps": self.processing_step,
-            "status": "success"
+            **extra
         })
     
-    def stop_processing(self):
-        """Stop processing."""
+    def _set_running_state(self, running):
+        """Enable the controls that match whether processing is running."""
+        if self.stop_button.isEnabled() == running:
+            return  # Already in this state, skip the redundant updates
+        self.start_button.setEnabled(not running)
+        self.stop_button.setEnabled(running)
+        self.progress_bar.setVisible(running)
+    
+    def _start_ticker(self):
+        """Start calling update_processing() every PROCESSING_INTERVAL_MS."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.processing_timer.start(self.PROCESSING_INTERVAL_MS)
+        else:
+            self._processing_task = loop.create_task(self._run_processing())
+    
+    def _stop_ticker(self):
+        """Stop the processing task or timer, whichever is running."""
         self.processing_timer.stop()
+        task, self._processing_task = self._processing_task, None
+        if task is not None:
+            task.cancel()
+    
+    async def _run_processing(self):
+        """Step through the simulation on the asyncio event loop."""
+        interval = self.PROCESSING_INTERVAL_MS / 1000
+        while self.processing_step < self.max_steps:
+            await asyncio.sleep(interval)
+            self.update_processing()
+    
+    def _post_event(self, event_name, data):
+        """
+        Send an event once control returns to the event loop.
         
-        # Update UI state
-        self.start_button.setEnabled(True)
-        self.stop_button.setEnabled(False)
-        self.progress_bar.setVisible(False)
-        
-        self.output_text.append("Processing stopped by user.")
-        self.log_message("Processing stopped")
-        
-        # Send stop event
-        self.send_event("processing_stopped", {
-            "extension": self.get_name(),
-            "steps": self.processing_step
-        })
+        Keeps slow event subscribers from blocking the slot that emitted
+        the event. Uses the running asyncio loop when the application runs
+        under QtAsyncio, and a zero-delay Qt timer otherwise.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            QTimer.singleShot(0, partial(self.send_event, event_name, data))
+        else:
+            loop.call_soon(self.send_event, event_name, data)
+    
+    def _append_output(self, text):
+        """Queue a line for the output area."""
+        self._log_buffer.append(text)
+        self._log_buffer_size += len(text)
+        if self._log_buffer_size >= self.LOG_FLUSH_THRESHOLD:
+            self._flush_log()
+        elif not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush_log(self):
+        """Write all queued lines to the output area in a single append."""
+        self._flush_timer.stop()
+        if self._log_buffer:
+            self.output_text.appendPlainText("\n".join(self._log_buffer))
+            self._log_buffer.clear()
+            self._log_buffer_size = 0
     
     def clear_output(self):
         """Clear the output area."""
+        self._flush_timer.stop()
+        self._log_buffer.clear()
+        self._log_buffer_size = 0
         self.output_text.clear()
         self.log_message("Output cleared")
     
@@ -5,11 +5,31 @@ A Python SDK for creating extensions for the MedICS (Medical Image Computing and
 This package provides the base classes and utilities needed to develop custom extensions.
 """
 
-__version__ = "0.0.1"
+from ._version import __version__
+
 __author__ = "MedICS Team"
 __email__ = "medics@example.com"
 __license__ = "MIT"
 
-from .base_extension import BaseExtension, apiDict
+# Never true at runtime; type checkers still analyze the imports below.
+# Private, and avoids importing typing at startup
+_TYPE_CHECKING = False
+if _TYPE_CHECKING:
+    from . import base_extension
+    from .base_extension import ApiInfo, BaseExtension, apiDict
+
+__all__ = ("ApiInfo", "BaseExtension", "apiDict")
+
+
+def __getattr__(name: str):
+    # Import base_extension on first use, so that running the
+    # medics-create-extension command doesn't load it
+    if name in __all__ or name == "base_extension":
+        from importlib import import_module
+        module = import_module(".base_extension", __name__)
+        return module if name == "base_extension" else getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-__all__ = ["BaseExtension", "apiDict"]
+def __dir__():
+    return sorted(set(globals()).union(__all__, ("base_extension",)))
@@ -0,0 +1,3 @@
+"""Version information for the MedICS Extension SDK."""
+
+__version__ = "0.0.1"
@@ -5,61 +5,228 @@ This module provides a base class for wrapping existing toolbox classes
 into proper extensions that can be discovered and managed by the extension system.
 """
 
-from abc import ABC, abstractmethod
+# This module is glue code: its costs are the import, loading Qt and a few
+# filesystem and string operations, all handled with lazy loading and
+# caching. There are no numeric loops, so it is deliberately kept as plain
+# Python; compiling it with Cython or Numba would not make it faster.
+
+from __future__ import annotations
+
+from abc import ABC, ABCMeta, abstractmethod
+from collections.abc import Mapping
+from functools import lru_cache, partial
+import logging
+import os
 from pathlib import Path
-import re
-from typing import Any, Optional, final
+import string
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, ClassVar, Final, Optional, Tuple
 
-try:
-    from PySide6 import QtWidgets, QtGui
-    QT_AVAILABLE = True
-except ImportError:
+
+# Mock classes used when Qt is not available
+class _MockQtWidgets:
+    class QWidget:
+        def __init__(self, *args, **kwargs):
+            pass
+        
+        def show(self):
+            pass
+        
+        def raise_(self):
+            pass
+        
+        def activateWindow(self):
+            pass
+
+
+class _MockQtGui:
+    class QAction:
+        def __init__(self, *args, **kwargs):
+            pass
+        
+        def setToolTip(self, text):
+            pass
+        
+        def setIcon(self, icon):
+            pass
+        
+        def triggered(self):
+            return _MockSignal()
+    
+    class QIcon:
+        def __init__(self, *args, **kwargs):
+            pass
+
+
+class _MockSignal:
+    def connect(self, callback):
+        pass
+
+
+@lru_cache(maxsize=1)
+def _load_qt():
+    """
+    Import the Qt binding on first use.
+    
+    Qt is not imported when this module is loaded, so headless callers such
+    as extension discovery or get_api() lookups don't pay for loading it.
+    
+    Returns:
+        tuple: (QT_AVAILABLE, QtWidgets, QtGui); mock classes stand in for
+        QtWidgets and QtGui when no Qt binding is installed
+    """
     try:
-        from PyQt6 import QtWidgets, QtGui
-        QT_AVAILABLE = True
+        from PySide6 import QtWidgets, QtGui
     except ImportError:
         try:
-            from PyQt5 import QtWidgets, QtGui
-            QT_AVAILABLE = True
+            from PyQt6 import QtWidgets, QtGui
         except ImportError:
-            # Create mock classes for when Qt is not available
-            QT_AVAILABLE = False
-            
-            class QtWidgets:
-                class QWidget:
-                    def __init__(self, *args, **kwargs):
-                        pass
-                    
-                    def show(self):
-                        pass
-                    
-                    def raise_(self):
-                        pass
-                    
-                    def activateWindow(self):
-                        pass
-            
-            class QtGui:
-                class QAction:
-                    def __init__(self, *args, **kwargs):
-                        pass
-                    
-                    def setToolTip(self, text):
-                        pass
-                    
-                    def setIcon(self, icon):
-                        pass
-                    
-                    def triggered(self):
-                        return MockSignal()
-                
-                class QIcon:
-                    def __init__(self, *args, **kwargs):
-                        pass
-            
-            class MockSignal:
-                def connect(self, callback):
-                    pass
+            try:
+                from PyQt5 import QtWidgets, QtGui
+            except ImportError:
+                QtWidgets, QtGui = _MockQtWidgets, _MockQtGui
+    qt_available = QtWidgets is not _MockQtWidgets
+    # Replace the placeholders, so the module attributes and the names
+    # typing.get_type_hints() resolves are the loaded modules
+    globals().update(QT_AVAILABLE=qt_available, QtWidgets=QtWidgets, QtGui=QtGui)
+    return qt_available, QtWidgets, QtGui
+
+
+class _LazyQtModule:
+    """Placeholder for QtWidgets or QtGui that loads Qt on attribute access."""
+
+    def __init__(self, index: int):
+        self._index = index
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(_load_qt()[self._index], name)
+
+
+if TYPE_CHECKING:
+    from PySide6 import QtWidgets, QtGui
+else:
+    # The annotations below name QtWidgets and QtGui; bind them so that
+    # typing.get_type_hints() can resolve them without importing Qt here
+    QtWidgets = _LazyQtModule(1)
+    QtGui = _LazyQtModule(2)
+
+
+def __getattr__(name: str) -> Any:
+    # QT_AVAILABLE used to be set when the module was imported; resolve it
+    # on first access, which also binds it as a module global
+    if name == "QT_AVAILABLE":
+        return _load_qt()[0]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Maps every ASCII character that is not allowed in extension IDs to "_"
+_ID_ALLOWED_CHARS = frozenset(string.ascii_lowercase + string.digits + "_.")
+_ID_SANITIZE_TABLE = str.maketrans({
+    chr(i): chr(i) if chr(i) in _ID_ALLOWED_CHARS else "_" for i in range(128)
+})
+
+
+# Extensions are usually constructed with the same names again and again
+@lru_cache(maxsize=256)
+def _sanitize_id(value: str) -> str:
+    """Replace every character not in [a-z0-9_.] with an underscore."""
+    value = value.translate(_ID_SANITIZE_TABLE)
+    if not value.isascii():
+        # "?" was already replaced above, so any left mark non-ASCII characters
+        value = value.encode("ascii", "replace").decode("ascii").replace("?", "_")
+    return value
+
+
+# Methods every concrete extension must implement, each with the class
+# attribute that can be set instead of overriding the method
+_ABSTRACT_METHODS = {"get_version": "version", "get_description": "description"}
+
+
+class _ExtensionMeta(ABCMeta):
+    """
+    ABCMeta that also accepts the metadata class attributes.
+    
+    get_version() and get_description() are abstract, but setting the
+    ``version`` or ``description`` class attribute to a non-empty string
+    implements them.
+    """
+
+    def __new__(mcls, name, bases, namespace, **kwargs):
+        cls = super().__new__(mcls, name, bases, namespace, **kwargs)
+        abstracts = set(cls.__abstractmethods__)
+        for method_name, attr in _ABSTRACT_METHODS.items():
+            overridden = not getattr(getattr(cls, method_name), "__isabstractmethod__", False)
+            value = getattr(cls, attr, None)
+            if overridden or (isinstance(value, str) and value):
+                abstracts.discard(method_name)
+            else:
+                abstracts.add(method_name)
+        cls.__abstractmethods__ = frozenset(abstracts)
+        return cls
+
+
+# Generic icon file names, checked after the extension-specific ones
+_ICON_FILE_NAMES = ("icon.png", "icon.ico", "extension.png", "extension.ico")
+
+
+def _scan_dir(directory: Path) -> dict:
+    """
+    List the files in a directory with a single scandir() call.
+    
+    Returns:
+        dict: Lowercased file name -> actual file name; empty if the
+        directory doesn't exist or can't be read
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name.lower(): entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return {}
+
+
+# app_context helpers shared by the extension methods and the methods
+# added to widgets, which differ only in where app_context comes from
+def _do_log(extension: BaseExtension, app_context: Any, message: str) -> None:
+    """Log a message through app_context's logger, or print it."""
+    if not app_context:
+        print(f"{extension.get_name()} (no context): {message}")
+        return
+    logger = getattr(app_context, 'logger', None)
+    if logger:
+        try:
+            if isinstance(logger, logging.Logger):
+                # Formatted only if the record is emitted
+                logger.info("%s%s", extension._log_prefix(), message)
+            else:
+                # Other loggers are duck-typed; pass one formatted string
+                logger.info(extension._log_prefix() + message)
+        except Exception as e:
+            print(f"{extension._log_prefix()}logging error: {e}")
+    else:
+        print(f"{extension._log_prefix()}{message}")
+
+
+def _do_get_config(extension: BaseExtension, app_context: Any, section: str, key: str, default=None):
+    """Get a value from app_context's config manager, or default."""
+    if app_context:
+        try:
+            config_manager = extension._lookup_component(app_context, "config_manager")
+            if config_manager:
+                return config_manager.get_value(section, key, default)
+        except Exception as e:
+            print(f"{extension._log_prefix()}config error: {e}")
+    return default
+
+
+def _do_send_event(extension: BaseExtension, app_context: Any, event_name: str, data: dict) -> None:
+    """Emit an event on app_context's event bus, if it has one."""
+    if app_context:
+        event_bus = getattr(app_context, 'event_bus', None)
+        if event_bus:
+            try:
+                event_bus.emit(event_name, data)
+            except Exception as e:
+                print(f"{extension._log_prefix()}event error: {e}")
 
 
 class apiDict(dict):
@@ -69,7 +236,126 @@ class apiDict(dict):
     __delattr__ = dict.__delitem__
 
 
-class BaseExtension(ABC):
+class _ApiNamespace(Mapping):
+    """
+    Read-only namespace of API callables that can also be read as a mapping.
+    
+    ``ns.process_image`` is the fast path; ``ns["process_image"]``,
+    ``ns.get(...)``, ``in`` and iteration keep working for code written
+    against the nested apiDict of the older format. The callables are kept
+    in an internal dict, so an API function named like a Mapping method
+    (``get``, ``keys``, ...) doesn't replace that method; read it with
+    ``ns["get"]``.
+    """
+    __slots__ = ("_functions",)
+
+    def __init__(self, functions: Mapping):
+        object.__setattr__(self, "_functions", dict(functions))
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for names that aren't methods or the _functions slot
+        if name != "_functions":
+            try:
+                return self._functions[name]
+            except KeyError:
+                pass
+        raise AttributeError(f"API has no function {name!r}")
+
+    def __setattr__(self, name, value):
+        raise AttributeError("API functions are read-only")
+
+    def __getitem__(self, key: str) -> Any:
+        return self._functions[key]
+
+    def __iter__(self):
+        return iter(self._functions)
+
+    def __len__(self) -> int:
+        return len(self._functions)
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()).union(self._functions))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._functions!r})"
+
+
+class ApiInfo(Mapping):
+    """
+    Description of an extension's public API, as returned by get_api().
+    
+    Fields are read as attributes, e.g. ``info.api.process_image``. For code
+    written against the older apiDict format, ApiInfo is also a read-only
+    mapping of its fields (``info["docs"]``, ``info.get("version")``,
+    ``"api" in info``, ``info.keys()``) and the api namespace supports item
+    access too (``info["api"]["process_image"]``). Code that needs a real
+    dict, e.g. for isinstance(..., dict) checks, can use to_dict(). Unlike
+    apiDict, unknown fields raise AttributeError when read as attributes.
+    
+    ApiInfo and its api namespace are read-only, so one object can be
+    shared by every caller of get_api().
+    """
+    __slots__ = ("extension_name", "api", "docs", "version")
+    # Set with object.__setattr__, since __setattr__ rejects all writes
+    extension_name: str
+    api: Any
+    docs: str
+    version: Optional[str]
+
+    def __init__(self, extension_name: str, api: Any, docs: str = "", version: Optional[str] = None):
+        """
+        Args:
+            extension_name: Name of the extension exposing the API
+            api: Namespace of the API callables, usually a SimpleNamespace;
+                a SimpleNamespace or mapping is converted to a read-only
+                namespace that also supports item access
+            docs: API documentation string
+            version: Optional API version string
+        """
+        if type(api) is SimpleNamespace:
+            api = _ApiNamespace(vars(api))
+        elif isinstance(api, Mapping) and not isinstance(api, _ApiNamespace):
+            api = _ApiNamespace(api)
+        object.__setattr__(self, "extension_name", extension_name)
+        object.__setattr__(self, "api", api)
+        object.__setattr__(self, "docs", docs)
+        object.__setattr__(self, "version", version)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Cannot modify read-only attribute '{name}'")
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def to_dict(self) -> apiDict:
+        """
+        Convert to the older apiDict format.
+        
+        Returns:
+            apiDict: A new dict of the fields, with the api namespace
+            converted to a nested apiDict
+        """
+        api = self.api
+        return apiDict(
+            extension_name=self.extension_name,
+            api=apiDict(api) if isinstance(api, Mapping) else api,
+            docs=self.docs,
+            version=self.version,
+        )
+
+    def __repr__(self) -> str:
+        return f"ApiInfo(extension_name={self.extension_name!r}, version={self.version!r})"
+
+
+class BaseExtension(ABC, metaclass=_ExtensionMeta):
     """
     Base class for all MedICS extensions.
     
@@ -91,11 +377,52 @@ class BaseExtension(ABC):
     3. Override create_widget() for widget-based extensions
     4. Use the app_context to access platform services
     """
-    __readonly__ = ("_id", "extension_name", "author_name")
+    __slots__ = (
+        "parent",
+        "app_context",
+        "extension_instance",
+        "_extension_path",
+        "_icon_candidates",
+        "_icon_path",
+        "_icon_path_resolved",
+        "_icon",
+        "_main_action",
+        "extension_widget",
+        "_cached_parent",
+        "_cached_components",
+        "id",
+        "extension_name",
+        "author_name",
+        "_locked",
+        "_cached_log_prefix",
+        "__weakref__",
+    )
+    __readonly__ = frozenset(("id", "extension_name", "author_name"))
+
+    # Unique extension identifier, generated from the author and extension
+    # names. Stored in a slot and read-only after __init__; Final tells type
+    # checkers that subclasses must not redefine it. mypy wants a Final
+    # initialized in the class body, but the slot is filled in __init__
+    id: Final[str]  # type: ignore[misc]
+    extension_name: str
+    author_name: str
+
+    # Methods cleanup() looks for on extension_instance, in order; only the
+    # first one found is called
+    _CLEANUP_METHODS: ClassVar[Tuple[str, ...]] = ("close", "cleanup")
+
+    # Extension metadata, readable from the class without instantiating it
+    category: ClassVar[str] = "General"
+    version: ClassVar[str] = ""
+    description: ClassVar[str] = ""
+
+    # ApiInfo built by the default get_api(), set on each class that calls it
+    _api_info: ClassVar[Optional[ApiInfo]] = None
+
     def __setattr__(self, name, value):
-        if hasattr(self, "_locked"): 
-            if name in self.__readonly__:
-                raise AttributeError(f"Cannot modify read-only attribute '{name}'")
+        # Check the name first: most assignments aren't to readonly attributes
+        if name in self.__readonly__ and hasattr(self, "_locked"):
+            raise AttributeError(f"Cannot modify read-only attribute '{name}'")
         super().__setattr__(name, value)
 
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None, extension_name: str = "extension_name", author_name: str = "author_name"):
@@ -109,18 +436,29 @@ class BaseExtension(ABC):
         self.app_context: Optional[Any] = None
         self.extension_instance: Optional[Any] = None
         self._extension_path: Optional[Path] = None
+        self._icon_candidates: Optional[Tuple[str, ...]] = None
+        self._icon_path: Optional[Path] = None
+        self._icon_path_resolved = False
+        self._icon: Optional[QtGui.QIcon] = None
         self._main_action: Optional[QtGui.QAction] = None
         self.extension_widget: Optional[QtWidgets.QWidget] = None
+        # (app_context, parent) pair from the last _resolve_parent() call
+        self._cached_parent: Optional[Tuple[Any, Any]] = None
+        # (app_context, {name: component}) for components already looked up
+        self._cached_components: Optional[Tuple[Any, dict]] = None
 
-        # Set readonly attributes directly in __dict__ to bypass __setattr__ and property restrictions
+        # Set readonly attributes with object.__setattr__ to bypass the __setattr__ check
         object.__setattr__(self, "extension_name", extension_name)
         object.__setattr__(self, "author_name", author_name)
-        # set the id based on author and extension name, underscores and lowercased and numbers are allowed, all other special chars replaced with _, remove spaces
-        id_value = f"{author_name}.{extension_name}".lower().replace(" ", "")
-        id_value = re.sub(r"[^a-z0-9_.]", "_", id_value)
-        object.__setattr__(self, "_id", id_value)  # Store as _id to avoid property conflict
+        # set the id based on author and extension name, lowercased; letters, numbers, underscores and dots are kept, all other chars (including spaces) replaced with _
+        id_value = _sanitize_id(f"{author_name}.{extension_name}".lower())
+        object.__setattr__(self, "id", id_value)
         object.__setattr__(self, "_locked", True)
 
+        # (name, "name: ") for the name get_name() last returned; get_name()
+        # isn't called here, as an override may read subclass attributes
+        self._cached_log_prefix = (extension_name, f"{extension_name}: ")
+
     def get_name(self) -> str:
         """
         Get extension name.
@@ -128,46 +466,41 @@ class BaseExtension(ABC):
         Returns:
             str: The display name of the extension
         """
-        return self.__dict__["extension_name"]
+        return self.extension_name
 
-    # def a readonly property for id, no setter, only getter, and prevent inherited classes from overriding it
-    @property
-    @final
-    def id(self) -> str:
-        """
-        Get extension ID.
-        
-        This property is read-only and cannot be overridden by subclasses.
-        
-        Returns:
-            str: The unique identifier for the extension
-        """
-        return self._id
-    
-    @id.setter
-    def id(self, value):
-        """Prevent setting the id property."""
-        raise AttributeError("Cannot modify read-only attribute 'id'")
+    def _log_prefix(self) -> str:
+        """Return the "<name>: " prefix of log messages."""
+        name = self.get_name()
+        cached_name, prefix = self._cached_log_prefix
+        if name != cached_name:
+            # get_name() is overridden and returned a different name
+            prefix = f"{name}: "
+            self._cached_log_prefix = (name, prefix)
+        return prefix
 
     @abstractmethod
     def get_version(self) -> str:
         """
         Get extension version.
         
+        Set the ``version`` class attribute or override this method.
+        
         Returns:
             str: The version string (e.g., "1.0.0")
         """
-        pass
+        return self.version
 
     @abstractmethod
     def get_description(self) -> str:
         """
         Get extension description.
         
+        Set the ``description`` class attribute or override this method.
+        
         Returns:
             str: A brief description of what the extension does
         """
-        pass
+        return self.description
 
     def get_author(self) -> str:
         """
@@ -182,47 +515,48 @@ class BaseExtension(ABC):
         """
         Get extension category.
         
+        Set the ``category`` class attribute to change it.
+        
         Returns:
             str: The category for organizing extensions (default: "General")
         """
-        return "General"
+        return self.category
 
     def get_icon_path(self) -> Optional[Path]:
         """
         Get the path to this extension's icon.
         
         This method searches for common icon file names in the extension
-        directory and its icons subdirectory.
+        directory and its icons subdirectory. File names are matched
+        case-insensitively. The result is cached until the extension path
+        changes.
         
         Returns:
             Optional[Path]: Path to the icon file, or None if not found
         """
+        if not self._icon_path_resolved:
+            self._icon_path = self._find_icon_path()
+            self._icon_path_resolved = True
+        return self._icon_path
+
+    def _find_icon_path(self) -> Optional[Path]:
+        """Search the extension directory for an icon file."""
         if not self._extension_path:
             return None
 
-        # Look for common icon file names
-        icon_names = [
-            f"{self.get_name().lower()}.png",
-            f"{self.get_name().lower()}.ico",
-            "icon.png",
-            "icon.ico",
-            "extension.png",
-            "extension.ico"
-        ]
-
-        # Check in extension root directory
-        for icon_name in icon_names:
-            icon_path = self._extension_path / icon_name
-            if icon_path.exists():
-                return icon_path
-
-        # Check in icons subdirectory
-        icons_dir = self._extension_path / "icons"
-        if icons_dir.exists():
-            for icon_name in icon_names:
-                icon_path = icons_dir / icon_name
-                if icon_path.exists():
-                    return icon_path
+        # Icon file names to look for, in order of preference. The name is
+        # fixed for the lifetime of the extension, so build them only once.
+        if self._icon_candidates is None:
+            name_lower = self.get_name().lower()
+            self._icon_candidates = (f"{name_lower}.png", f"{name_lower}.ico") + _ICON_FILE_NAMES
+
+        # Check in extension root directory, then in icons subdirectory,
+        # listing each directory once instead of probing every name
+        for directory in (self._extension_path, self._extension_path / "icons"):
+            file_names = _scan_dir(directory)
+            for icon_name in self._icon_candidates:
+                if icon_name in file_names:
+                    return directory / file_names[icon_name]
 
         return None
 
@@ -233,13 +567,15 @@ class BaseExtension(ABC):
         Returns:
             Optional[QtGui.QIcon]: The icon, or None if not available
         """
-        if not QT_AVAILABLE:
+        qt_available, _, QtGui = _load_qt()
+        if not qt_available:
             return None
             
-        icon_path = self.get_icon_path()
-        if icon_path and icon_path.exists():
-            return QtGui.QIcon(str(icon_path))
-        return None
+        if self._icon is None:
+            icon_path = self.get_icon_path()
+            if icon_path:
+                self._icon = QtGui.QIcon(str(icon_path))
+        return self._icon
 
     def set_extension_path(self, path: Path) -> None:
         """
@@ -249,6 +585,9 @@ class BaseExtension(ABC):
             path: Path to the extension directory
         """
         self._extension_path = path
+        self._icon_path = None
+        self._icon_path_resolved = False
+        self._icon = None
 
     def initialize(self, app_context: Any) -> bool:
         """
@@ -260,23 +599,21 @@ class BaseExtension(ABC):
         Returns:
             bool: True if initialization was successful
         """
-        try:
-            self.app_context = app_context
-            return True
-        except Exception as e:
-            print(f"Failed to initialize extension {self.get_name()}: {e}")
-            return False
+        self.app_context = app_context
+        self._cached_components = None
+        return True
 
     def cleanup(self) -> None:
         """Cleanup extension resources when the extension is being removed."""
         if self.extension_instance:
             try:
-                if hasattr(self.extension_instance, "close"):
-                    self.extension_instance.close()
-                elif hasattr(self.extension_instance, "cleanup"):
-                    self.extension_instance.cleanup()
+                for method_name in self._CLEANUP_METHODS:
+                    method = getattr(self.extension_instance, method_name, None)
+                    if method is not None:
+                        method()
+                        break
             except Exception as e:
-                print(f"Error cleaning up {self.get_name()}: {e}")
+                print(f"{self._log_prefix()}error cleaning up: {e}")
             finally:
                 self.extension_instance = None
 
@@ -305,7 +642,8 @@ class BaseExtension(ABC):
         Returns:
             Optional[QtGui.QAction]: The menu action for launching this extension
         """
-        if not QT_AVAILABLE:
+        qt_available, _, QtGui = _load_qt()
+        if not qt_available:
             return None
             
         if not self._main_action:
@@ -362,17 +700,20 @@ class BaseExtension(ABC):
         
         try:
             parent = kwargs.get("parent", self.parent)
-            if parent is None and self.app_context:
-                if hasattr(self.app_context, "main_window"):
-                    parent = self.app_context.main_window
-                elif isinstance(self.app_context, QtWidgets.QWidget):
-                    parent = self.app_context
+            if parent is None:
+                parent = self._resolve_parent()
                     
             # Try to create a widget if the subclass implements create_widget
-            if hasattr(self, "create_widget") and callable(getattr(self, "create_widget")):
-                self.extension_widget = self.create_widget(parent, **kwargs)
+            create_widget = getattr(self, "create_widget", None)
+            if callable(create_widget):
+                self.extension_widget = create_widget(parent, **kwargs)
                 self.extension_instance = self.extension_widget
                 
+                # Forget the widget once Qt deletes it so the next call rebuilds it
+                destroyed = getattr(self.extension_widget, "destroyed", None)
+                if destroyed is not None:
+                    destroyed.connect(self._on_widget_destroyed)
+                
                 # Automatically pass app_context to the widget if it supports it
                 self._setup_widget_app_context(self.extension_widget)
                 
@@ -381,6 +722,36 @@ class BaseExtension(ABC):
         except Exception as e:
             raise RuntimeError(f"Failed to create {self.get_name()} widget: {e}") from e
 
+    def _resolve_parent(self) -> Any:
+        """
+        Get the default parent widget from the app context.
+        
+        The result is cached until app_context changes.
+        
+        Returns:
+            The main window, the app context itself if it is a widget, or None
+        """
+        app_context = self.app_context
+        if not app_context:
+            return None
+        cached = self._cached_parent
+        if cached is not None and cached[0] is app_context:
+            return cached[1]
+        
+        parent = None
+        if hasattr(app_context, "main_window"):
+            parent = app_context.main_window
+        elif isinstance(app_context, _load_qt()[1].QWidget):
+            parent = app_context
+        self._cached_parent = (app_context, parent)
+        return parent
+
+    def _on_widget_destroyed(self, *args: Any) -> None:
+        """Drop the references to the extension widget after Qt deletes it."""
+        if self.extension_instance is self.extension_widget:
+            self.extension_instance = None
+        self.extension_widget = None
+
     def show_extension(self) -> None:
         """
         Show the extension.
@@ -388,7 +759,8 @@ class BaseExtension(ABC):
         Default implementation for widget-based extensions. Shows the widget as a tab
         in the main window UI if possible, otherwise shows it as a standalone window.
         """
-        if not QT_AVAILABLE:
+        qt_available, _, _ = _load_qt()
+        if not qt_available:
             print(f"Cannot show extension {self.get_name()}: Qt not available")
             return
             
@@ -398,9 +770,8 @@ class BaseExtension(ABC):
         
         if self.extension_widget and self.app_context:
             ui_manager = self.app_context.get_component("ui_manager")
-            if ui_manager and hasattr(ui_manager, "main_window_ui") and ui_manager.main_window_ui:
-                main_window_ui = ui_manager.main_window_ui
-                
+            main_window_ui = getattr(ui_manager, "main_window_ui", None) if ui_manager else None
+            if main_window_ui:
                 # Check if extension is already open as a tab
                 tab_index = main_window_ui.find_tab_by_widget(self.extension_widget)
                 if tab_index >= 0:
@@ -410,21 +781,19 @@ class BaseExtension(ABC):
                     # Add new tab
                     tab_index = main_window_ui.add_tab(self.extension_widget, self.get_name())
                     if tab_index >= 0:
-                        icon_path = self.get_icon_path()
-                        if icon_path and icon_path.exists():
-                            icon = QtGui.QIcon(str(icon_path))
+                        icon = self.get_icon()
+                        if icon is not None:
                             central_widget = main_window_ui.get_central_widget()
                             if central_widget:
                                 central_widget.setTabIcon(tab_index, icon)
                         main_window_ui.set_current_tab(tab_index)
             else:
                 # Fallback for when UI manager is not available
-                if hasattr(self.extension_widget, "show"):
-                    self.extension_widget.show()
-                if hasattr(self.extension_widget, "raise_"):
-                    self.extension_widget.raise_()
-                if hasattr(self.extension_widget, "activateWindow"):
-                    self.extension_widget.activateWindow()
+                widget = self.extension_widget
+                for method_name in ("show", "raise_", "activateWindow"):
+                    method = getattr(widget, method_name, None)
+                    if method is not None:
+                        method()
 
     def _setup_widget_app_context(self, widget: QtWidgets.QWidget) -> None:
         """
@@ -435,8 +804,9 @@ class BaseExtension(ABC):
         """
         if widget and self.app_context:
             # If the widget has a set_app_context method, call it
-            if hasattr(widget, 'set_app_context') and callable(getattr(widget, 'set_app_context')):
-                widget.set_app_context(self.app_context)
+            set_app_context = getattr(widget, 'set_app_context', None)
+            if callable(set_app_context):
+                set_app_context(self.app_context)
             # If the widget doesn't have app_context methods, add them dynamically
             elif not hasattr(widget, 'app_context'):
                 self._add_app_context_methods_to_widget(widget)
@@ -451,68 +821,37 @@ class BaseExtension(ABC):
         # Set the app_context attribute
         widget.app_context = self.app_context
         
-        # Add app_context access methods to the widget
-        widget.get_app_context = lambda: widget.app_context
-        widget.log_message = lambda msg: self._widget_log_message(widget, msg)
-        widget.get_config_value = lambda section, key, default=None: self._widget_get_config_value(widget, section, key, default)
-        widget.send_event = lambda event_name, data: self._widget_send_event(widget, event_name, data)
+        # Add app_context access methods to the widget, as partials of the
+        # shared helpers rather than a new closure per method and widget
+        widget.get_app_context = partial(getattr, widget, "app_context")
+        widget.log_message = partial(self._widget_log_message, widget)
+        widget.get_config_value = partial(self._widget_get_config_value, widget)
+        widget.send_event = partial(self._widget_send_event, widget)
     
     def _widget_log_message(self, widget: QtWidgets.QWidget, message: str) -> None:
         """Log a message using the app_context's logging system."""
-        if widget.app_context:
-            try:
-                # Access the logger through app_context
-                logger = getattr(widget.app_context, 'logger', None)
-                if logger:
-                    logger.info(f"{self.get_name()}: {message}")
-                else:
-                    print(f"{self.get_name()}: {message}")
-            except Exception as e:
-                print(f"{self.get_name()} logging error: {e}")
-        else:
-            print(f"{self.get_name()} (no context): {message}")
+        _do_log(self, widget.app_context, message)
     
     def _widget_get_config_value(self, widget: QtWidgets.QWidget, section: str, key: str, default=None):
         """Get a configuration value using the app_context."""
-        if widget.app_context:
-            try:
-                config_manager = widget.app_context.get_component("config_manager")
-                if config_manager:
-                    return config_manager.get_value(section, key, default)
-            except Exception as e:
-                print(f"{self.get_name()} config error: {e}")
-        return default
+        return _do_get_config(self, widget.app_context, section, key, default)
     
     def _widget_send_event(self, widget: QtWidgets.QWidget, event_name: str, data: dict) -> None:
         """Send an event through the app_context's event bus."""
-        if widget.app_context:
-            try:
-                event_bus = getattr(widget.app_context, 'event_bus', None)
-                if event_bus:
-                    event_bus.emit(event_name, data)
-            except Exception as e:
-                print(f"{self.get_name()} event error: {e}")
+        _do_send_event(self, widget.app_context, event_name, data)
 
     # Extension-level app_context access methods
     def log_message(self, message: str) -> None:
         """
         Log a message using the app_context's logging system.
         
+        The message is passed to ``logger.info`` as a ``%s`` argument, so it
+        is only formatted if the logger handles INFO records.
+        
         Args:
             message: The message to log
         """
-        if self.app_context:
-            try:
-                # Access the logger through app_context
-                logger = getattr(self.app_context, 'logger', None)
-                if logger:
-                    logger.info(f"{self.get_name()}: {message}")
-                else:
-                    print(f"{self.get_name()}: {message}")
-            except Exception as e:
-                print(f"{self.get_name()} logging error: {e}")
-        else:
-            print(f"{self.get_name()} (no context): {message}")
+        _do_log(self, self.app_context, message)
     
     def get_config_value(self, section: str, key: str, default=None):
         """
@@ -526,14 +865,7 @@ class BaseExtension(ABC):
         Returns:
             The configuration value or default
         """
-        if self.app_context:
-            try:
-                config_manager = self.app_context.get_component("config_manager")
-                if config_manager:
-                    return config_manager.get_value(section, key, default)
-            except Exception as e:
-                print(f"{self.get_name()} config error: {e}")
-        return default
+        return _do_get_config(self, self.app_context, section, key, default)
     
     def set_config_value(self, section: str, key: str, value) -> bool:
         """
@@ -549,12 +881,12 @@ class BaseExtension(ABC):
         """
         if self.app_context:
             try:
-                config_manager = self.app_context.get_component("config_manager")
+                config_manager = self._lookup_component(self.app_context, "config_manager")
                 if config_manager:
                     config_manager.set_value(section, key, value)
                     return True
             except Exception as e:
-                print(f"{self.get_name()} config set error: {e}")
+                print(f"{self._log_prefix()}config set error: {e}")
         return False
     
     def send_event(self, event_name: str, data: dict) -> None:
@@ -565,13 +897,7 @@ class BaseExtension(ABC):
             event_name: Name of the event
             data: Event data dictionary
         """
-        if self.app_context:
-            try:
-                event_bus = getattr(self.app_context, 'event_bus', None)
-                if event_bus:
-                    event_bus.emit(event_name, data)
-            except Exception as e:
-                print(f"{self.get_name()} event error: {e}")
+        _do_send_event(self, self.app_context, event_name, data)
     
     def get_component(self, component_name: str):
         """
@@ -585,11 +911,32 @@ class BaseExtension(ABC):
         """
         if self.app_context:
             try:
-                return self.app_context.get_component(component_name)
+                return self._lookup_component(self.app_context, component_name)
             except Exception as e:
-                print(f"{self.get_name()} component access error: {e}")
+                print(f"{self._log_prefix()}component access error: {e}")
         return None
     
+    def _lookup_component(self, app_context: Any, component_name: str) -> Any:
+        """
+        Get a component from app_context, reusing earlier lookups.
+        
+        Components found on the extension's own app_context are cached
+        until it is replaced or initialize() is called again. Missing
+        components are not cached, so they are found once registered.
+        """
+        if app_context is not self.app_context:
+            return app_context.get_component(component_name)
+        cached = self._cached_components
+        if cached is None or cached[0] is not app_context:
+            cached = self._cached_components = (app_context, {})
+        components = cached[1]
+        component = components.get(component_name)
+        if component is None:
+            component = app_context.get_component(component_name)
+            if component is not None:
+                components[component_name] = component
+        return component
+
     def get_main_window(self):
         """
         Get the main window from the app_context.
@@ -607,36 +954,45 @@ class BaseExtension(ABC):
         return None
 
     @classmethod
-    def get_api(cls) -> apiDict:
+    def get_api(cls) -> ApiInfo:
         """
-        Returns a dictionary exposing the extension's public API.
+        Returns an object describing the extension's public API.
         
         Override this method to provide a programmatic API for your extension
-        that other extensions or the main application can use.
+        that other extensions or the main application can use. The default
+        implementation builds the ApiInfo once per class and returns the
+        same read-only object on later calls.
         
         Returns:
-            apiDict: Dictionary containing the extension's API
+            ApiInfo: The extension's API
             
         Example:
-            {
-                "extension_name": "MyExtension",
-                "api": {
-                    "process_image": function_reference,
-                    "get_results": function_reference,
-                },
-                "docs": "API documentation string",
-                "version": "1.0.0"
-            }
-        """
-        return apiDict({
-            "extension_name": "BaseExtension",
-            "api": apiDict({
-                "example_api_method": cls.example_api_method,
-                "sub_func1": cls.sub_func1,
-                "sub_func2": cls.sub_func2,
-            }),
-            "docs": cls.get_api_docs(),
-        })
+            ApiInfo(
+                extension_name="MyExtension",
+                api=SimpleNamespace(
+                    process_image=function_reference,
+                    get_results=function_reference,
+                ),
+                docs="API documentation string",
+                version="1.0.0",
+            )
+        """
+        # Cached on the class itself rather than in a global cache, so
+        # classes of reloaded extensions can still be garbage collected;
+        # a value inherited from a base class was built for that class
+        info = cls.__dict__.get("_api_info")
+        if info is None:
+            info = ApiInfo(
+                extension_name="BaseExtension",
+                api=SimpleNamespace(
+                    example_api_method=cls.example_api_method,
+                    sub_func1=cls.sub_func1,
+                    sub_func2=cls.sub_func2,
+                ),
+                docs=cls.get_api_docs(),
+            )
+            cls._api_info = info
+        return info
 
     @staticmethod
     def example_api_method(param1, param2):
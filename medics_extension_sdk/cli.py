@@ -1,443 +1,208 @@
 """Command-line interface for MedICS Extension SDK."""
 
 import argparse
+import codecs
+from functools import lru_cache
 import os
 import sys
-from pathlib import Path
-from typing import Dict, Any
 
-def create_extension_template(name: str, output_dir: str, id = "example_extension_id", category: str = "General", author: str = "Unknown") -> None:
-    """Create a new extension template."""
-    
-    # Sanitize the extension name for file/class names
-    class_name = "".join(word.capitalize() for word in name.replace("-", " ").replace("_", " ").split())
-    file_name = name.lower().replace(" ", "_").replace("-", "_")
-    
-    extension_dir = Path(output_dir) / file_name
-    extension_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Create __init__.py
-    init_content = f'''"""
-{name} - A MedICS Extension
+from ._version import __version__
 
-{name} extension for the MedICS platform.
-"""
+# Only what argument parsing needs is imported at module level, so that
+# --help and --version don't pay for modules used to write the files
 
-from .{file_name} import {class_name}
+_TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), "templates")
 
-__version__ = "1.0.0"
-__author__ = "{author}"
 
-# Extension entry point
-Extension = {class_name}
-'''
-    
-    (extension_dir / "__init__.py").write_text(init_content)
-    
-    # Create main extension file
-    extension_content = f'''"""
-{name} Extension for MedICS
-
-This extension provides {name.lower()} functionality for the MedICS platform.
-"""
-
-from medics_extension_sdk import BaseExtension
-from pathlib import Path
-from typing import Optional
-
-try:
-    from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QTextEdit
-    from PySide6.QtCore import Qt
-    QT_AVAILABLE = True
-except ImportError:
-    try:
-        from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QTextEdit
-        from PyQt6.QtCore import Qt
-        QT_AVAILABLE = True
-    except ImportError:
-        QT_AVAILABLE = False
-        # Mock classes for when Qt is not available
-        class QWidget:
-            def __init__(self, *args, **kwargs): pass
-        class QVBoxLayout:
-            def __init__(self, *args, **kwargs): pass
-            def addWidget(self, widget): pass
-        class QLabel:
-            def __init__(self, *args, **kwargs): pass
-        class QPushButton:
-            def __init__(self, *args, **kwargs): pass
-            def clicked(self): return MockSignal()
-        class QTextEdit:
-            def __init__(self, *args, **kwargs): pass
-            def append(self, text): pass
-        class Qt:
-            AlignCenter = None
-        class MockSignal:
-            def connect(self, callback): pass
-
-
-class {class_name}(BaseExtension):
+@lru_cache(maxsize=None)
+def _load_template(template_name: str):
     """
-    {name} extension for MedICS.
+    Read a template from the package's templates directory, once per process.
     
-    This extension provides {name.lower()} functionality including:
-    - Feature 1: Description
-    - Feature 2: Description
-    - Feature 3: Description
+    Placeholders use string.Template's $name syntax, so the braces of the
+    generated Python code don't need escaping.
     """
+    from string import Template
     
-    def __init__(self, parent: Optional[QWidget] = None):
-        """Initialize the {name} extension."""
-        super().__init__(parent)
-        self.results = []
-    
-    def get_name(self) -> str:
-        """Get extension name."""
-        return "{name}"
-    
-    def get_version(self) -> str:
-        """Get extension version."""
-        return "1.0.0"
-    
-    def get_description(self) -> str:
-        """Get extension description."""
-        return "Provides {name.lower()} functionality for medical image analysis"
-    
-    def get_author(self) -> str:
-        """Get extension author."""
-        return "{author}"
-    
-    def get_category(self) -> str:
-        """Get extension category."""
-        return "{category}"
-    
-    def create_widget(self, parent: Optional[QWidget] = None, **kwargs) -> QWidget:
-        """
-        Create the main widget for this extension.
-        
-        Args:
-            parent: Parent widget
-            **kwargs: Additional arguments
-            
-        Returns:
-            QWidget: The main extension widget
-        """
-        if not QT_AVAILABLE:
-            raise RuntimeError("Qt is not available. Please install PySide6, PyQt6, or PyQt5.")
-        
-        widget = QWidget(parent)
-        layout = QVBoxLayout(widget)
-        
-        # Title
-        title = QLabel("{name}")
-        title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet("font-size: 16px; font-weight: bold; margin: 10px;")
-        layout.addWidget(title)
-        
-        # Description
-        description = QLabel(self.get_description())
-        description.setAlignment(Qt.AlignCenter)
-        description.setWordWrap(True)
-        layout.addWidget(description)
-        
-        # Control buttons
-        self.process_button = QPushButton("Start Processing")
-        self.process_button.clicked.connect(self.process_data)
-        layout.addWidget(self.process_button)
-        
-        self.clear_button = QPushButton("Clear Results")
-        self.clear_button.clicked.connect(self.clear_results)
-        layout.addWidget(self.clear_button)
-        
-        # Results area
-        self.results_text = QTextEdit()
-        self.results_text.setReadOnly(True)
-        self.results_text.setPlaceholderText("Processing results will appear here...")
-        layout.addWidget(self.results_text)
-        
-        return widget
-    
-    def process_data(self):
-        """Process data using this extension."""
-        try:
-            self.log_message("Starting {name.lower()} processing...")
-            
-            # Get workspace data if available
-            workspace_manager = self.get_component("workspace_manager")
-            if workspace_manager:
-                # Access workspace data
-                workspace_data = workspace_manager.get_workspace_data()
-                self.log_message(f"Found {{len(workspace_data)}} items in workspace")
-            
-            # Example processing
-            result = self.perform_analysis()
-            
-            # Update UI
-            if hasattr(self, 'results_text'):
-                self.results_text.append(f"Processing completed: {{result}}")
-            
-            # Store results
-            self.results.append(result)
-            
-            # Send event to notify other extensions
-            self.send_event("{file_name}_completed", {{
-                "extension": self.get_name(),
-                "result": result,
-                "timestamp": "now"
-            }})
-            
-            self.log_message("{name} processing completed successfully")
-            
-        except Exception as e:
-            error_msg = f"Error in {{self.get_name()}}: {{str(e)}}"
-            self.log_message(error_msg)
-            if hasattr(self, 'results_text'):
-                self.results_text.append(f"ERROR: {{error_msg}}")
-    
-    def perform_analysis(self) -> str:
-        """
-        Perform the main analysis for this extension.
-        
-        Returns:
-            str: Analysis result
-        """
-        # TODO: Implement your analysis logic here
-        
-        # Example: Get configuration values
-        threshold = self.get_config_value("{file_name}", "threshold", 0.5)
-        method = self.get_config_value("{file_name}", "method", "default")
-        
-        # Example processing logic
-        result = f"Analysis completed with threshold={{threshold}}, method={{method}}"
-        
-        return result
-    
-    def clear_results(self):
-        """Clear processing results."""
-        self.results.clear()
-        if hasattr(self, 'results_text'):
-            self.results_text.clear()
-        self.log_message("Results cleared")
-    
-    def initialize(self, app_context) -> bool:
-        """
-        Initialize the extension with app context.
-        
-        Args:
-            app_context: MedICS application context
-            
-        Returns:
-            bool: True if initialization successful
-        """
-        success = super().initialize(app_context)
-        if success:
-            # Set default configuration values
-            self.set_config_value("{file_name}", "threshold", 0.5)
-            self.set_config_value("{file_name}", "method", "default")
-            self.log_message(f"{{self.get_name()}} initialized successfully")
-        return success
-    
-    def cleanup(self):
-        """Cleanup extension resources."""
-        self.clear_results()
-        super().cleanup()
-        self.log_message(f"{{self.get_name()}} cleaned up")
-    
-    @classmethod
-    def get_api(cls):
-        """
-        Get the extension's public API.
-        
-        Returns:
-            apiDict: Dictionary containing the extension's API
-        """
-        from medics_extension_sdk import apiDict
-        
-        return apiDict({{
-            "extension_name": "{name}",
-            "api": apiDict({{
-                "process_data": cls.api_process_data,
-                "get_results": cls.api_get_results,
-                "set_threshold": cls.api_set_threshold,
-            }}),
-            "docs": cls.get_api_docs(),
-            "version": "1.0.0"
-        }})
-    
-    @staticmethod
-    def api_process_data(config: dict = None) -> dict:
-        """
-        API method to process data programmatically.
-        
-        Args:
-            config: Processing configuration
-            
-        Returns:
-            dict: Processing results
-        """
-        # TODO: Implement API processing logic
-        return {{"status": "completed", "message": "API processing completed"}}
-    
-    @staticmethod
-    def api_get_results() -> list:
-        """
-        API method to get processing results.
-        
-        Returns:
-            list: List of processing results
-        """
-        # TODO: Implement result retrieval
-        return []
-    
-    @staticmethod
-    def api_set_threshold(threshold: float) -> bool:
-        """
-        API method to set processing threshold.
-        
-        Args:
-            threshold: Processing threshold value
-            
-        Returns:
-            bool: True if successful
-        """
-        # TODO: Implement threshold setting
-        return True
-    
-    @classmethod
-    def get_api_docs(cls) -> str:
-        """Get API documentation."""
-        return """
-        {name} Extension API:
-        
-        Methods:
-        - process_data(config=None): Process data with optional configuration
-        - get_results(): Get list of processing results
-        - set_threshold(threshold): Set processing threshold
-        
-        Example Usage:
-        ```python
-        # Get the extension API
-        api = extension.get_api()
-        
-        # Process data
-        result = api.api.process_data({{"method": "advanced"}})
-        
-        # Get results
-        results = api.api.get_results()
-        
-        # Set threshold
-        api.api.set_threshold(0.7)
-        ```
-        """
-'''
-    
-    (extension_dir / f"{file_name}.py").write_text(extension_content)
-    
-    # Create icon placeholder
-    icon_dir = extension_dir / "icons"
-    icon_dir.mkdir(exist_ok=True)
-    
-    # Create a simple README for the extension
-    readme_content = f'''# {name}
+    with open(os.path.join(_TEMPLATES_DIR, template_name), encoding="utf-8") as f:
+        return Template(f.read())
 
-A MedICS extension for {name.lower()} functionality.
 
-## Description
+@lru_cache(maxsize=None)
+def _load_static(file_name: str) -> bytes:
+    """Read a file from the templates directory that needs no rendering."""
+    with open(os.path.join(_TEMPLATES_DIR, file_name), "rb") as f:
+        return f.read()
 
-{name} provides advanced {name.lower()} capabilities for medical image analysis within the MedICS platform.
 
-## Features
+def _render(template_name: str, context: dict) -> str:
+    """Render a template with ``$name`` placeholders filled from context."""
+    return _load_template(template_name).substitute(context)
 
-- Feature 1: Description
-- Feature 2: Description  
-- Feature 3: Description
 
-## Installation
+# Word separators are dropped from class names; " " and "-" become "_" in file names
+_CLASS_NAME_SEPARATORS = str.maketrans("", "", " -_")
+_FILE_NAME_SEPARATORS = str.maketrans(" -", "__")
 
-1. Copy this extension directory to your MedICS extensions folder
-2. Restart MedICS
-3. The extension will be automatically discovered and loaded
 
-## Usage
+@lru_cache(maxsize=128)
+def _extension_names(name: str):
+    """
+    Derive the names used in the generated files from the extension name.
+    
+    Returns:
+        tuple: (class_name, file_name, name_lower)
+    """
+    name_lower = name.lower()
+    # Sanitize the extension name for file/class names
+    class_name = name.title().translate(_CLASS_NAME_SEPARATORS)
+    file_name = name_lower.translate(_FILE_NAME_SEPARATORS)
+    return class_name, file_name, name_lower
 
-1. Open MedICS
-2. Navigate to Extensions → {category} → {name}
-3. Use the interface to process your data
 
-## Configuration
+# One UTF-8 encoder shared by every generated file
+_encode_utf8 = codecs.getencoder("utf-8")
 
-The extension supports the following configuration options:
+# O_BINARY keeps Windows from translating newlines; it is 0 elsewhere
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
 
-- `threshold`: Processing threshold (default: 0.5)
-- `method`: Processing method (default: "default")
 
-## API
+def _write_files(files) -> None:
+    """
+    Write each (path, content) pair; str content is encoded as UTF-8.
+    
+    Each file is written with unbuffered os.write calls on a raw file
+    descriptor, usually a single call for these small files.
+    """
+    for path, content in files:
+        if isinstance(content, str):
+            content, _ = _encode_utf8(content)
+        data = memoryview(content)
+        fd = os.open(path, _WRITE_FLAGS, 0o666)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
 
-This extension provides a programmatic API for other extensions:
 
-```python
-# Access the extension API
-api = extension_manager.get_extension_api("{name}")
+# Values of --qt-binding; "fallback" tries PySide6, then PyQt6, then mocks
+_QT_BINDINGS = ("fallback", "PySide6", "PyQt6")
 
-# Process data
-result = api.process_data({{"method": "advanced"}})
 
-# Get results
-results = api.get_results()
-```
+def _qt_imports(qt_binding: str = "fallback") -> str:
+    """
+    Render the Qt imports for the generated extension module.
+    
+    By default the module gets the runtime fallback chain that ends in mock
+    classes, so it doesn't depend on which binding is installed where the
+    template is generated. A specific binding is imported directly only
+    when asked for.
+    """
+    if qt_binding == "fallback":
+        return _load_template("qt_imports_fallback.py.tmpl").template
+    if qt_binding not in _QT_BINDINGS:
+        raise ValueError(f"qt_binding must be one of {', '.join(_QT_BINDINGS)}, got {qt_binding!r}")
+    return _render("qt_imports_direct.py.tmpl", {"qt_binding": qt_binding})
 
-## Author
 
-{author}
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be a positive integer."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
 
-## Version
 
-1.0.0
-'''
-    
-    (extension_dir / "README.md").write_text(readme_content)
+def create_extension_template(name: str, output_dir: str, id = "example_extension_id", category: str = "General", author: str = "Unknown", results_cap: int = 1000, qt_binding: str = "fallback", quiet: bool = False) -> None:
+    """Create a new extension template."""
+    if results_cap <= 0:
+        raise ValueError(f"results_cap must be a positive integer, got {results_cap!r}")
+    # Also validates qt_binding before any file is written
+    qt_imports = _qt_imports(qt_binding)
+    
+    class_name, file_name, name_lower = _extension_names(name)
+    
+    # normpath drops the "./" that the default --output "." would add
+    extension_dir = os.path.normpath(os.path.join(output_dir, file_name))
+    os.makedirs(extension_dir, exist_ok=True)
+    
+    context = {
+        "name": name,
+        "name_lower": name_lower,
+        "class_name": class_name,
+        "file_name": file_name,
+        "id": id,
+        "category": category,
+        "author": author,
+        "results_cap": results_cap,
+        "qt_imports": qt_imports,
+    }
     
-    # Create configuration template
-    config_content = f'''# Configuration for {name} Extension
+    # Create icon placeholder
+    os.makedirs(os.path.join(extension_dir, "icons"), exist_ok=True)
+    
+    _write_files([
+        # Package entry point
+        (os.path.join(extension_dir, "__init__.py"), _render("extension_init.py.tmpl", context)),
+        # Main extension file
+        (os.path.join(extension_dir, f"{file_name}.py"), _render("extension_main.py.tmpl", context)),
+        # A simple README for the extension
+        (os.path.join(extension_dir, "README.md"), _render("extension_readme.md.tmpl", context)),
+        # Configuration template; only the header depends on the extension
+        (os.path.join(extension_dir, "config.ini"),
+         _encode_utf8(f"# Configuration for {name} Extension\n\n[{file_name}]\n")[0]
+         + _load_static("extension_config.ini.static")),
+    ])
+    
+    if quiet:
+        return
+    
+    sys.stdout.write(
+        "✅ Extension template created successfully!\n"
+        f"📁 Location: {extension_dir}\n"
+        f"📝 Extension class: {class_name}\n"
+        f"🔧 Main file: {file_name}.py\n"
+        "\n"
+        "Next steps:\n"
+        "1. Implement your extension logic in the perform_analysis() method\n"
+        "2. Customize the UI in create_widget() method\n"
+        "3. Add your extension directory to MedICS extensions folder\n"
+        "4. Test your extension in MedICS\n"
+    )
 
-[{file_name}]
-# Processing threshold (0.0 - 1.0)
-threshold = 0.5
 
-# Processing method
-method = default
+_EPILOG = """
+Examples:
+  medics-create-extension "Image Segmentation" --category Segmentation --author "Dr. Smith"
+  medics-create-extension "Custom Viewer" --output ./my_extensions --category Visualization
+        """
 
-# Enable debug mode
-debug = false
 
-# Output format
-output_format = json
-'''
+def create_extension_command(argv=None):
+    """
+    Command-line entry point for creating extensions.
     
-    (extension_dir / "config.ini").write_text(config_content)
+    Args:
+        argv: Command-line arguments; defaults to sys.argv[1:]
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    # Answer a bare --version without building the parser
+    if argv == ["--version"]:
+        print(f"MedICS Extension SDK {__version__}")
+        return
     
-    print(f"✅ Extension template created successfully!")
-    print(f"📁 Location: {extension_dir}")
-    print(f"📝 Extension class: {class_name}")
-    print(f"🔧 Main file: {file_name}.py")
-    print()
-    print("Next steps:")
-    print("1. Implement your extension logic in the perform_analysis() method")
-    print("2. Customize the UI in create_widget() method")
-    print("3. Add your extension directory to MedICS extensions folder")
-    print("4. Test your extension in MedICS")
-
-
-def create_extension_command():
-    """Command-line entry point for creating extensions."""
+    # The examples epilog is only shown in the help output
+    show_epilog = "-h" in argv or "--help" in argv
     parser = argparse.ArgumentParser(
         description="Create a new MedICS extension template",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  medics-create-extension "Image Segmentation" --category Segmentation --author "Dr. Smith"
-  medics-create-extension "Custom Viewer" --output ./my_extensions --category Visualization
-        """
+        epilog=_EPILOG if show_epilog else None
     )
     
     parser.add_argument(
@@ -465,20 +230,44 @@ Examples:
         help="Extension author name (default: Unknown)"
     )
     
+    parser.add_argument(
+        "--results-cap",
+        type=_positive_int,
+        default=1000,
+        help="Maximum number of results the extension keeps (default: 1000)"
+    )
+    
+    parser.add_argument(
+        "--qt-binding",
+        default="fallback",
+        choices=_QT_BINDINGS,
+        help="Qt binding the extension imports; 'fallback' tries PySide6, "
+             "then PyQt6 at runtime (default: fallback)"
+    )
+    
+    parser.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Don't print the summary and next steps after creating the extension"
+    )
+    
     parser.add_argument(
         "--version",
         action="version",
-        version="MedICS Extension SDK 1.0.0"
+        version=f"MedICS Extension SDK {__version__}"
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     try:
         create_extension_template(
             name=args.name,
             output_dir=args.output,
             category=args.category,
-            author=args.author
+            author=args.author,
+            results_cap=args.results_cap,
+            qt_binding=args.qt_binding,
+            quiet=args.quiet
         )
     except Exception as e:
         print(f"❌ Error creating extension: {e}", file=sys.stderr)
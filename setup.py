@@ -8,7 +8,7 @@ readme_file = Path(__file__).parent / "README.md"
 long_description = readme_file.read_text(encoding="utf-8") if readme_file.exists() else ""
 
 # Read version from the package
-version_file = Path(__file__).parent / "medics_extension_sdk" / "__init__.py"
+version_file = Path(__file__).parent / "medics_extension_sdk" / "_version.py"
 version = "0.0.3"
 if version_file.exists():
     with open(version_file, "r", encoding="utf-8") as f:
@@ -60,8 +60,9 @@ setup(
         "qt5": ["PyQt5>=5.15.0"],
         "pyqt6": ["PyQt6>=6.0.0"],
         "dev": [
-            "pytest>=6.0",
+            "pytest>=7.0",
             "pytest-cov",
+            "pytest-xdist",
             "black",
             "flake8",
             "mypy",
@@ -75,7 +76,7 @@ setup(
         ],
     },
     package_data={
-        "medics_extension_sdk": ["py.typed"],
+        "medics_extension_sdk": ["py.typed", "templates/*"],
     },
     include_package_data=True,
     zip_safe=False,
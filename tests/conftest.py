@@ -0,0 +1,31 @@
+"""Shared fixtures for the MedICS Extension SDK tests."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def base_ext_cls():
+    """The BaseExtension class, imported once per test session."""
+    from medics_extension_sdk import BaseExtension
+    return BaseExtension
+
+
+@pytest.fixture(scope="session")
+def sample_ext_cls(base_ext_cls):
+    """A minimal concrete extension class for the id tests."""
+    class SampleExtension(base_ext_cls):
+        """Test extension implementation."""
+        
+        def get_version(self) -> str:
+            return "1.0.0"
+        
+        def get_description(self) -> str:
+            return "Test extension"
+    
+    return SampleExtension
+
+
+@pytest.fixture(scope="module")
+def ext(sample_ext_cls):
+    """One extension shared by the tests that only read or try to modify it."""
+    return sample_ext_cls(extension_name="TestExt", author_name="TestAuthor")
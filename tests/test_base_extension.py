@@ -1,19 +1,95 @@
 """Tests for the MedICS Extension SDK."""
 
+import logging
+
 import pytest
-from medics_extension_sdk import BaseExtension, apiDict
+from medics_extension_sdk import ApiInfo, BaseExtension, apiDict
 
 
 def test_package_import():
     """Test that the package can be imported successfully."""
     assert BaseExtension is not None
+    assert ApiInfo is not None
     assert apiDict is not None
 
 
-def test_base_extension_abstract():
+def test_base_extension_abstract(base_ext_cls):
     """Test that BaseExtension is an abstract class."""
     with pytest.raises(TypeError):
-        BaseExtension()
+        base_ext_cls()
+
+
+def test_subclass_missing_required_method_is_abstract(base_ext_cls):
+    """Test that a subclass without every required method can't be instantiated."""
+    class IncompleteExtension(base_ext_cls):
+        def get_version(self) -> str:
+            return "1.0.0"
+    
+    with pytest.raises(TypeError, match="get_description"):
+        IncompleteExtension()
+
+
+def test_abc_mixin_keeps_required_methods(base_ext_cls):
+    """Test that an ABC mixin doesn't drop the required methods."""
+    import abc
+    
+    class Mixin(abc.ABC):
+        @abc.abstractmethod
+        def process(self):
+            pass
+    
+    class MixedExtension(base_ext_cls, Mixin):
+        pass
+    
+    assert MixedExtension.__abstractmethods__ == {"get_version", "get_description", "process"}
+    with pytest.raises(TypeError, match="get_description"):
+        MixedExtension()
+    
+    class AttributeExtension(MixedExtension):
+        version = "1.0.0"
+        description = "Declared with class attributes"
+    
+    assert AttributeExtension.__abstractmethods__ == {"process"}
+    
+    class CompleteExtension(AttributeExtension):
+        def process(self):
+            pass
+    
+    assert CompleteExtension().get_version() == "1.0.0"
+
+
+def test_metadata_attribute_must_be_a_non_empty_string(base_ext_cls):
+    """Test that only a real string class attribute implements get_version()."""
+    class PropertyExtension(base_ext_cls):
+        description = "Test"
+        
+        @property
+        def version(self):
+            return "1.0.0"
+    
+    class SlotExtension(base_ext_cls):
+        __slots__ = ("version",)
+        description = "Test"
+    
+    for cls in (PropertyExtension, SlotExtension):
+        assert cls.__abstractmethods__ == {"get_version"}
+        with pytest.raises(TypeError, match="get_version"):
+            cls()
+
+
+def test_abc_registration(base_ext_cls):
+    """Test that BaseExtension is still a regular ABC."""
+    import abc
+    
+    class Registered:
+        pass
+    
+    class ExtensionInterface(base_ext_cls):
+        pass
+    
+    assert issubclass(base_ext_cls, abc.ABC)
+    ExtensionInterface.register(Registered)
+    assert isinstance(Registered(), ExtensionInterface)
 
 
 class MockExtension(BaseExtension):
@@ -42,11 +118,259 @@ def test_mock_extension():
     assert ext.get_description() == "A test extension"
     assert ext.get_version() == "1.0.0"
     assert ext.get_author() == "Test Author"
+    assert ext.get_category() == "General"
     # Test auto-generated ID
     assert ext.id == "test_author.test_extension"
     assert ext.create_widget() is None
 
 
+def test_category_class_attribute():
+    """Test that the category can be set as a class attribute."""
+    class CategorizedExtension(MockExtension):
+        category = "Analysis"
+    
+    assert CategorizedExtension.category == "Analysis"
+    assert CategorizedExtension().get_category() == "Analysis"
+
+
+def test_metadata_class_attributes():
+    """Test that version and description can be set as class attributes."""
+    class AttributeExtension(BaseExtension):
+        version = "2.0.0"
+        description = "Declared with class attributes"
+    
+    assert AttributeExtension.version == "2.0.0"
+    ext = AttributeExtension(extension_name="Attributes", author_name="Test Author")
+    assert ext.get_version() == "2.0.0"
+    assert ext.get_description() == "Declared with class attributes"
+    
+    class VersionOnlyExtension(BaseExtension):
+        version = "2.0.0"
+    
+    with pytest.raises(TypeError, match="get_description"):
+        VersionOnlyExtension()
+
+
+def test_icon_path_lookup(tmp_path):
+    """Test that the icon is found in the icons subdirectory and cached."""
+    ext = MockExtension()
+    assert ext.get_icon_path() is None
+    
+    icons_dir = tmp_path / "icons"
+    icons_dir.mkdir()
+    (icons_dir / "Icon.png").write_bytes(b"")
+    ext.set_extension_path(tmp_path)
+    assert ext.get_icon_path() == icons_dir / "Icon.png"
+    
+    # A name-specific icon in the root directory takes precedence,
+    # but only after the extension path is set again
+    (tmp_path / "test extension.png").write_bytes(b"")
+    assert ext.get_icon_path() == icons_dir / "Icon.png"
+    ext.set_extension_path(tmp_path)
+    assert ext.get_icon_path() == tmp_path / "test extension.png"
+
+
+def test_widget_receives_app_context_methods():
+    """Test that widgets without app_context support get helper methods."""
+    class Widget:
+        pass
+    
+    class ConfigManager:
+        def get_value(self, section, key, default=None):
+            return (section, key, default)
+    
+    class AppContext:
+        def get_component(self, name):
+            return ConfigManager() if name == "config_manager" else None
+    
+    ext = MockExtension()
+    ext.initialize(AppContext())
+    widget = Widget()
+    ext._setup_widget_app_context(widget)
+    
+    assert widget.get_app_context() is ext.app_context
+    assert widget.get_config_value("section", "key") == ("section", "key", None)
+    assert widget.get_config_value("section", "key", default=1) == ("section", "key", 1)
+
+
+def test_get_component_is_cached_until_initialize():
+    """Test that components are looked up once per app_context."""
+    class AppContext:
+        def __init__(self):
+            self.lookups = []
+        
+        def get_component(self, name):
+            self.lookups.append(name)
+            return object() if name == "config_manager" else None
+    
+    ext = MockExtension()
+    context = AppContext()
+    ext.initialize(context)
+    
+    component = ext.get_component("config_manager")
+    assert ext.get_component("config_manager") is component
+    assert ext.get_component("missing") is None
+    assert ext.get_component("missing") is None
+    assert context.lookups == ["config_manager", "missing", "missing"]
+    
+    ext.initialize(context)
+    assert ext.get_component("config_manager") is not component
+
+
+def test_create_instance_reuses_widget_until_destroyed():
+    """Test that the widget is reused until Qt reports it destroyed."""
+    class Signal:
+        def __init__(self):
+            self.slots = []
+        
+        def connect(self, slot):
+            self.slots.append(slot)
+    
+    class Widget:
+        def __init__(self, parent):
+            self.parent = parent
+            self.destroyed = Signal()
+    
+    class WidgetExtension(MockExtension):
+        def create_widget(self, parent=None, **kwargs):
+            return Widget(parent)
+    
+    main_window = object()
+    ext = WidgetExtension()
+    ext.initialize(type("AppContext", (), {"main_window": main_window})())
+    
+    widget = ext.create_instance()
+    assert widget.parent is main_window
+    assert ext.create_instance() is widget
+    
+    for slot in widget.destroyed.slots:
+        slot()
+    assert ext.extension_widget is None
+    assert ext.extension_instance is None
+    assert ext.create_instance() is not widget
+
+
+@pytest.mark.parametrize("methods, expected", [
+    (("close", "cleanup"), ["close"]),
+    (("cleanup",), ["cleanup"]),
+    ((), []),
+])
+def test_cleanup_calls_first_cleanup_method(methods, expected):
+    """Test that cleanup() calls only the first cleanup method found."""
+    calls = []
+    instance = type("Instance", (), {
+        name: (lambda self, name=name: calls.append(name)) for name in methods
+    })()
+    
+    ext = MockExtension()
+    ext.extension_instance = instance
+    ext.cleanup()
+    assert calls == expected
+    assert ext.extension_instance is None
+
+
+def test_log_message_prefix(capsys, caplog):
+    """Test that log messages are prefixed with the extension name."""
+    class Logger:
+        def __init__(self):
+            self.messages = []
+        
+        def info(self, msg, *args):
+            # Duck-typed host logger that ignores extra arguments
+            self.messages.append(msg)
+    
+    ext = MockExtension()
+    ext.log_message("hello")
+    assert capsys.readouterr().out == "Test Extension (no context): hello\n"
+    
+    ext.initialize(type("AppContext", (), {"logger": Logger()})())
+    ext.log_message("hello")
+    assert ext.app_context.logger.messages == ["Test Extension: hello"]
+    
+    # A standard library logger formats the message lazily
+    logger = logging.getLogger("medics_extension_sdk.tests")
+    ext.initialize(type("AppContext", (), {"logger": logger})())
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        ext.log_message("hello")
+    assert [(r.msg, r.getMessage()) for r in caplog.records] == [("%s%s", "Test Extension: hello")]
+
+
+def test_get_api():
+    """Test that get_api returns an ApiInfo with attribute access."""
+    info = MockExtension.get_api()
+    assert isinstance(info, ApiInfo)
+    assert info.api.example_api_method is MockExtension.example_api_method
+    assert info["docs"] == info.docs
+    assert info.version is None
+    with pytest.raises(KeyError):
+        info["missing"]
+    with pytest.raises(AttributeError):
+        info.api.missing
+    # Built once per class
+    assert MockExtension.get_api() is info
+    assert BaseExtension.get_api() is not info
+
+
+def test_get_api_cache_does_not_keep_classes_alive():
+    """Test that the cached ApiInfo doesn't keep an extension class alive."""
+    import gc
+    import weakref
+    
+    class TemporaryExtension(MockExtension):
+        pass
+    
+    assert TemporaryExtension.get_api() is TemporaryExtension.get_api()
+    assert TemporaryExtension.get_api() is not MockExtension.get_api()
+    ref = weakref.ref(TemporaryExtension)
+    del TemporaryExtension
+    gc.collect()
+    assert ref() is None
+
+
+def test_api_info_mapping_compatibility():
+    """Test that ApiInfo can still be read like the older apiDict."""
+    info = MockExtension.get_api()
+    assert info.get("version") is None
+    assert info.get("missing", "default") == "default"
+    assert "docs" in info
+    assert "missing" not in info
+    assert list(info.keys()) == ["extension_name", "api", "docs", "version"]
+    assert len(info) == 4
+    assert dict(info)["docs"] == info.docs
+    
+    # The api namespace is subscriptable like the nested apiDict was
+    assert info["api"]["example_api_method"] is MockExtension.example_api_method
+    assert info.api.get("example_api_method") is MockExtension.example_api_method
+    assert info.api.get("missing") is None
+    assert "sub_func1" in info["api"]
+    assert ApiInfo("Test", {"func": len}).api.func is len
+
+    # API functions named like Mapping methods don't replace them
+    api = ApiInfo("Test", {"get": len}).api
+    assert api.get("missing") is None
+    assert api["get"] is len
+    
+    # Shared between callers, so neither level can be modified
+    with pytest.raises(AttributeError):
+        info.docs = "changed"
+    with pytest.raises(AttributeError):
+        info.api.example_api_method = None
+
+
+def test_api_info_to_dict():
+    """Test that to_dict() returns the older apiDict format."""
+    import json
+    
+    info = ApiInfo("Test", {"func": len}, docs="Docs", version="1.0")
+    data = info.to_dict()
+    assert isinstance(data, apiDict)
+    assert isinstance(data["api"], dict)
+    assert data.api.func is len
+    assert data == {"extension_name": "Test", "api": {"func": len}, "docs": "Docs", "version": "1.0"}
+    data["api"] = {}
+    assert json.loads(json.dumps(data))["docs"] == "Docs"
+
+
 def test_extension_id_is_readonly():
     """Test that extension ID is readonly and cannot be modified."""
     ext = MockExtension()
@@ -97,3 +421,72 @@ def test_extension_id_format():
     special_ext = SpecialExtension()
     # Special chars should be replaced with underscores
     assert special_ext.id == "john_doe.my_extension_"
+
+
+def test_extension_id_non_ascii():
+    """Test that non-ASCII characters are replaced one-for-one."""
+    class UnicodeExtension(BaseExtension):
+        def __init__(self):
+            super().__init__(extension_name="Bildanalyse?", author_name="Dr. Müller")
+        
+        def get_version(self) -> str:
+            return "1.0.0"
+        
+        def get_description(self) -> str:
+            return "Test"
+    
+    assert UnicodeExtension().id == "dr._m_ller.bildanalyse_"
+
+
+def test_get_name_override_reading_subclass_attributes():
+    """Test the MIGRATION_GUIDE pattern of a get_name() using subclass state."""
+    class DynamicExtension(BaseExtension):
+        def __init__(self, parent=None, mode="standard"):
+            super().__init__(parent=parent,
+                             extension_name="Dynamic Extension",
+                             author_name="Author")
+            self.mode = mode
+        
+        def get_name(self) -> str:
+            return f"{self.extension_name} ({self.mode})"
+        
+        def get_version(self) -> str:
+            return "1.0.0"
+        
+        def get_description(self) -> str:
+            return "Test"
+    
+    ext = DynamicExtension(mode="fast")
+    assert ext.get_name() == "Dynamic Extension (fast)"
+    assert ext._log_prefix() == "Dynamic Extension (fast): "
+    
+    # Later name changes show up in the log prefix
+    ext.mode = "slow"
+    assert ext._log_prefix() == "Dynamic Extension (slow): "
+    assert "_log_prefix" not in vars(DynamicExtension)
+
+
+def test_qt_annotations_resolve_at_runtime():
+    """Test that typing.get_type_hints() resolves the Qt annotations."""
+    import typing
+    from medics_extension_sdk.base_extension import _load_qt
+    
+    hints = typing.get_type_hints(BaseExtension.__init__)
+    assert hints["parent"] == typing.Optional[_load_qt()[1].QWidget]
+
+
+def test_package_attributes():
+    """Test that the lazily imported names are visible on the package."""
+    import subprocess
+    import sys
+    from pathlib import Path
+    
+    # A fresh interpreter, so base_extension isn't imported yet
+    code = (
+        "import medics_extension_sdk as sdk\n"
+        "assert sdk.base_extension.BaseExtension is sdk.BaseExtension\n"
+        "names = set(dir(sdk))\n"
+        "assert {'ApiInfo', 'BaseExtension', 'apiDict', 'base_extension'} <= names\n"
+        "assert 'TYPE_CHECKING' not in names\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).parent.parent)
@@ -0,0 +1,181 @@
+"""Tests for the extension template generator."""
+
+import os
+import stat
+
+import pytest
+
+from medics_extension_sdk.cli import _extension_names, create_extension_command, create_extension_template
+
+
+def test_create_extension_template(tmp_path, capsys):
+    """Test that every template file is rendered with the extension names."""
+    create_extension_template("Image Seg-tool", str(tmp_path), category="Analysis", author="Dr. Smith")
+    
+    extension_dir = tmp_path / "image_seg_tool"
+    assert sorted(p.name for p in extension_dir.iterdir()) == [
+        "README.md", "__init__.py", "config.ini", "icons", "image_seg_tool.py",
+    ]
+    
+    init_source = (extension_dir / "__init__.py").read_text(encoding="utf-8")
+    assert "from .image_seg_tool import ImageSegTool" in init_source
+    assert '__author__ = "Dr. Smith"' in init_source
+    
+    main_source = (extension_dir / "image_seg_tool.py").read_text(encoding="utf-8")
+    compile(main_source, "image_seg_tool.py", "exec")
+    assert "class ImageSegTool(BaseExtension):" in main_source
+    # Literal braces in the generated code are not doubled
+    assert 'config_section = "image_seg_tool"' in main_source
+    assert 'self.send_event("image_seg_tool_completed", {' in main_source
+    assert "{{" not in main_source
+    
+    assert "[image_seg_tool]" in (extension_dir / "config.ini").read_text(encoding="utf-8")
+    assert "Extensions → Analysis → Image Seg-tool" in (extension_dir / "README.md").read_text(encoding="utf-8")
+    assert "Extension template created successfully" in capsys.readouterr().out
+
+
+def test_create_extension_template_quiet(tmp_path, capsys):
+    """Test that quiet mode creates the files without printing."""
+    create_extension_template("Viewer", str(tmp_path), quiet=True)
+    assert (tmp_path / "viewer" / "viewer.py").is_file()
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.skipif(os.name != "posix", reason="file modes follow the umask only on POSIX")
+def test_generated_files_respect_umask(tmp_path):
+    """Test that generated files get 0o666 masked by the user's umask."""
+    old_umask = os.umask(0o002)
+    try:
+        create_extension_template("Viewer", str(tmp_path), quiet=True)
+    finally:
+        os.umask(old_umask)
+    mode = stat.S_IMODE((tmp_path / "viewer" / "viewer.py").stat().st_mode)
+    assert mode == 0o664
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("Image Segmentation", ("ImageSegmentation", "image_segmentation", "image segmentation")),
+    ("my-custom_viewer", ("MyCustomViewer", "my_custom_viewer", "my-custom_viewer")),
+    ("3D  View", ("3DView", "3d__view", "3d  view")),
+])
+def test_extension_names(name, expected):
+    """Test how class and file names are derived from the extension name."""
+    assert _extension_names(name) == expected
+
+
+def test_generated_extension_qt_imports_are_portable(tmp_path, monkeypatch):
+    """Test that the Qt imports don't depend on the generator's environment."""
+    import importlib.util
+    
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: object() if name == "PyQt6" else None)
+    create_extension_template("Viewer", str(tmp_path), quiet=True)
+    
+    source = (tmp_path / "viewer" / "viewer.py").read_text(encoding="utf-8")
+    assert "from PySide6.QtWidgets import" in source
+    assert "from PyQt6.QtWidgets import" in source
+    assert "except ImportError" in source
+
+
+def test_generated_extension_imports_chosen_qt_binding(tmp_path):
+    """Test that --qt-binding imports one binding directly."""
+    create_extension_command(["Viewer", "--output", str(tmp_path), "--qt-binding", "PyQt6", "--quiet"])
+    
+    source = (tmp_path / "viewer" / "viewer.py").read_text(encoding="utf-8")
+    compile(source, "viewer.py", "exec")
+    assert "from PyQt6.QtWidgets import" in source
+    assert "from PySide6" not in source
+    assert "except ImportError" not in source
+
+
+def test_unknown_qt_binding_is_rejected(tmp_path):
+    """Test that an unknown Qt binding is rejected before writing files."""
+    with pytest.raises(ValueError, match="qt_binding"):
+        create_extension_template("Viewer", str(tmp_path), qt_binding="Tkinter", quiet=True)
+    assert not (tmp_path / "viewer").exists()
+
+
+def test_version_option(capsys):
+    """Test that --version prints the SDK version."""
+    from medics_extension_sdk import __version__
+    
+    create_extension_command(["--version"])
+    assert capsys.readouterr().out == f"MedICS Extension SDK {__version__}\n"
+
+
+def test_help_option_shows_examples(capsys):
+    """Test that the help output includes the usage examples."""
+    with pytest.raises(SystemExit):
+        create_extension_command(["--help"])
+    assert "Examples:" in capsys.readouterr().out
+
+
+def test_generated_extension_can_be_instantiated(tmp_path, monkeypatch):
+    """Test that the generated extension class works with BaseExtension."""
+    import importlib
+    
+    create_extension_template("Image Seg-tool", str(tmp_path), category="Analysis", author="Dr. Smith", quiet=True)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module = importlib.import_module("image_seg_tool")
+    
+    ext = module.Extension()
+    assert ext.id == "dr._smith.image_seg_tool"
+    assert ext.get_name() == "Image Seg-tool"
+    assert ext.get_author() == "Dr. Smith"
+    assert ext.get_version() == "1.0.0"
+    assert ext.get_category() == "Analysis"
+    assert ext.get_api_docs().startswith("\nImage Seg-tool Extension API:\n")
+    assert module.__all__ == ("Extension", "ImageSegTool", "__version__", "__author__")
+
+
+def test_generated_extension_results_are_capped(tmp_path, monkeypatch):
+    """Test that the generated extension keeps at most results_cap results."""
+    import importlib
+    
+    create_extension_template("Capped Viewer", str(tmp_path), results_cap=2, quiet=True)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module = importlib.import_module("capped_viewer")
+    
+    ext = module.Extension()
+    for result in ("first", "second", "third"):
+        ext.results.append(result)
+    assert list(ext.results) == ["second", "third"]
+
+
+def test_generated_extension_runs_headless(tmp_path, monkeypatch):
+    """Test that the generated extension processes data without a widget."""
+    import importlib
+    
+    create_extension_template("Headless Tool", str(tmp_path), quiet=True)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module = importlib.import_module("headless_tool")
+    
+    ext = module.Extension()
+    assert ext.results_text is None
+    ext.process_data()
+    assert len(ext.results) == 1
+    ext.clear_results()
+    assert len(ext.results) == 0
+
+
+@pytest.mark.parametrize("results_cap", [0, -1])
+def test_results_cap_must_be_positive(tmp_path, results_cap):
+    """Test that a non-positive results cap is rejected before writing files."""
+    with pytest.raises(ValueError, match="results_cap"):
+        create_extension_template("Viewer", str(tmp_path), results_cap=results_cap, quiet=True)
+    assert not (tmp_path / "viewer").exists()
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "ten"])
+def test_results_cap_option_must_be_positive(tmp_path, capsys, value):
+    """Test that --results-cap rejects values that aren't positive integers."""
+    with pytest.raises(SystemExit):
+        create_extension_command(["Viewer", "--output", str(tmp_path), "--results-cap", value])
+    assert "must be a positive integer" in capsys.readouterr().err
+    assert not (tmp_path / "viewer").exists()
+
+
+def test_summary_location_in_current_directory(tmp_path, monkeypatch, capsys):
+    """Test that the default output directory isn't printed as a ./ prefix."""
+    monkeypatch.chdir(tmp_path)
+    create_extension_command(["Viewer"])
+    assert "📁 Location: viewer\n" in capsys.readouterr().out
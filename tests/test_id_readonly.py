@@ -2,66 +2,51 @@
 Test to verify that the id property is readonly and cannot be overridden.
 """
 
+import re
+
 import pytest
 from medics_extension_sdk import BaseExtension
 
 
-class TestExtension(BaseExtension):
-    """Test extension implementation."""
-    
-    def get_version(self) -> str:
-        return "1.0.0"
-    
-    def get_description(self) -> str:
-        return "Test extension"
+# Error messages for the readonly attributes, compiled once for every test
+_READONLY_ERRORS = {
+    name: re.compile(f"^Cannot modify read-only attribute '{name}'")
+    for name in ("id", "extension_name", "author_name")
+}
 
 
-def test_id_is_readonly():
-    """Test that id cannot be modified after initialization."""
-    ext = TestExtension(extension_name="TestExt", author_name="TestAuthor")
+@pytest.mark.parametrize("attr, original", [
+    ("id", "testauthor.testext"),
+    ("extension_name", "TestExt"),
+    ("author_name", "TestAuthor"),
+])
+def test_readonly_attribute_cannot_be_set(ext, attr, original):
+    """Test that readonly attributes can't be modified after initialization."""
+    assert getattr(ext, attr) == original
     
-    # Verify the id is set correctly
-    assert ext.id == "testauthor.testext"
-    
-    # Try to modify the id directly - should raise AttributeError
-    with pytest.raises(AttributeError, match="Cannot modify read-only attribute 'id'"):
-        ext.id = "modified_id"
+    # Assignment and setattr() both go through __setattr__
+    with pytest.raises(AttributeError, match=_READONLY_ERRORS[attr]):
+        setattr(ext, attr, "modified")
     
-    # Verify id hasn't changed
-    assert ext.id == "testauthor.testext"
+    # Verify the value hasn't changed
+    assert getattr(ext, attr) == original
 
 
-def test_id_cannot_be_set_via_setattr():
-    """Test that id cannot be modified using __setattr__."""
-    ext = TestExtension(extension_name="TestExt", author_name="TestAuthor")
-    
-    # Try to modify using setattr
-    with pytest.raises(AttributeError, match="Cannot modify read-only attribute 'id'"):
-        setattr(ext, "id", "modified_id")
-    
-    # Verify id hasn't changed
+def test_id_cannot_be_assigned(ext):
+    """Test that id cannot be modified with a plain assignment."""
+    with pytest.raises(AttributeError, match=_READONLY_ERRORS["id"]):
+        ext.id = "modified_id"
     assert ext.id == "testauthor.testext"
 
 
-def test_id_property_exists():
-    """Test that id is accessible as a property."""
-    ext = TestExtension(extension_name="TestExt", author_name="TestAuthor")
-    
-    # Verify we can read the id
-    ext_id = ext.id
-    assert isinstance(ext_id, str)
-    assert ext_id == "testauthor.testext"
-
-
-def test_id_format():
-    """Test that id is formatted correctly."""
-    ext = TestExtension(extension_name="My Extension!", author_name="John Doe")
-    
-    # Verify special characters are replaced and text is lowercased
-    assert ext.id == "john_doe.my_extension_"
-    
-    ext2 = TestExtension(extension_name="Test123", author_name="Author")
-    assert ext2.id == "author.test123"
+def test_id_cannot_be_set_via_instance_dict(ext):
+    """Test that writing to the instance __dict__ does not change the id."""
+    # The readonly values live in slots, so a __dict__ entry is ignored
+    ext.__dict__["id"] = "modified_id"
+    try:
+        assert ext.id == "testauthor.testext"
+    finally:
+        del ext.__dict__["id"]
 
 
 def test_cannot_override_id_property_in_subclass():
@@ -89,20 +74,3 @@ def test_cannot_override_id_property_in_subclass():
     # Even if someone tries to override, the base class protection should work
     ext = BadExtension(extension_name="Test", author_name="Author")
     assert ext.id == "author.test"
-
-
-def test_extension_name_and_author_are_also_readonly():
-    """Test that extension_name and author_name are also readonly."""
-    ext = TestExtension(extension_name="TestExt", author_name="TestAuthor")
-    
-    # Try to modify extension_name
-    with pytest.raises(AttributeError, match="Cannot modify read-only attribute 'extension_name'"):
-        ext.extension_name = "Modified"
-    
-    # Try to modify author_name
-    with pytest.raises(AttributeError, match="Cannot modify read-only attribute 'author_name'"):
-        ext.author_name = "Modified"
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])